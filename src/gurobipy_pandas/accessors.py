@@ -5,6 +5,7 @@ Accessor methods bound to pd.Index.gppd, pd.Series.gppd, pd.DataFrame.gppd
 from typing import Optional, Union
 
 import gurobipy as gp
+import numpy as np
 import pandas as pd
 from gurobipy import GRB
 
@@ -34,6 +35,46 @@ def _convert_single_value(value):
     raise TypeError("Method requires a single numeric value or string")
 
 
+def _same_model(objs):
+    """Return True if all gurobipy objects in the list :objs are known to
+    belong to the same model. Matrix objects built by fromlist do not check
+    this, and would silently read or write attributes of the wrong objects
+    if the list mixes models."""
+    # _cmodel is a private gurobipy attribute (a handle shared by all objects
+    # of one model). If it is missing, batching is disabled; the test suite
+    # checks that single-model series still take the batched path.
+    cmodel = getattr(objs[0], "_cmodel", None)
+    if cmodel is None:
+        return False
+    return all(getattr(obj, "_cmodel", None) is cmodel for obj in objs)
+
+
+def _matrix_object(objs):
+    """Return a gurobipy matrix-friendly object (MVar, MConstr, or MQConstr)
+    holding the gurobipy objects in the list :objs, so that attributes can be
+    queried or set in a single call. Return None if this is not possible:
+    the list is empty, holds other or mixed object types, holds objects from
+    more than one model, or the installed gurobipy does not provide fromlist
+    (added in version 10)."""
+    if not objs or not _same_model(objs):
+        return None
+    for scalar_type, matrix_type in (
+        (gp.Var, "MVar"),
+        (gp.Constr, "MConstr"),
+        (gp.QConstr, "MQConstr"),
+    ):
+        if isinstance(objs[0], scalar_type):
+            fromlist = getattr(getattr(gp, matrix_type, None), "fromlist", None)
+            if fromlist is None:
+                return None
+            try:
+                return fromlist(objs)
+            except ValueError:
+                # Not all objects have the same type
+                return None
+    return None
+
+
 @pd.api.extensions.register_dataframe_accessor("gppd")
 class GRBDataFrameAccessor:
     """Accessor class for methods invoked as :code:`pd.DataFrame(...).gppd.*`.
@@ -42,6 +83,8 @@ class GRBDataFrameAccessor:
     accessor API
     """
 
+    __slots__ = ("_obj",)
+
     def __init__(self, pandas_obj: pd.DataFrame):
         self._obj = pandas_obj
 
@@ -220,6 +263,8 @@ class GRBSeriesAccessor:
     accessor API
     """
 
+    __slots__ = ("_obj",)
+
     def __init__(self, pandas_obj):
         self._obj = pandas_obj
 
@@ -253,11 +298,25 @@ class GRBSeriesAccessor:
         Series
             A new series with the evaluated attributes
         """
-        return pd.Series(
-            index=self._obj.index,
-            data=[v.getAttr(attr) for v in self._obj],
-            name=self._obj.name,
-        )
+        objs = self._obj.tolist()
+        mobj = _matrix_object(objs)
+        data = None
+        if mobj is not None:
+            try:
+                data = mobj.getAttr(attr)
+            except (gp.GurobiError, AttributeError):
+                # e.g. no solution available, or an unknown attribute; the
+                # per-object loop raises the same AttributeError as gurobipy's
+                # scalar objects
+                pass
+            else:
+                if data.dtype.kind == "i":
+                    # gurobipy returns int32 arrays; match the int64 dtype
+                    # pandas gives the per-object values
+                    data = data.astype(np.int64)
+        if data is None:
+            data = [v.getAttr(attr) for v in objs]
+        return pd.Series(index=self._obj.index, data=data, name=self._obj.name)
 
     def __getattr__(self, attr):
         """Retrieve the given Gurobi attribute for every object in the
@@ -335,16 +394,24 @@ class GRBSeriesAccessor:
         Series
             The original series (allowing method chaining)
         """
+        objs = self._obj.tolist()
+        mobj = _matrix_object(objs)
         if isinstance(value, pd.Series):
             aligned = align_series(value, self._obj.index, attr)
-            for entry in pd.DataFrame({"x": self._obj, "v": aligned}).itertuples(
-                index=False
-            ):
-                entry.x.setAttr(attr, entry.v)
+            if mobj is not None:
+                mobj.setAttr(attr, aligned.to_numpy())
+            else:
+                # gurobipy's scalar setAttr rejects numpy integers for integer
+                # attributes, so pass Python values
+                for v, val in zip(objs, aligned.tolist()):
+                    v.setAttr(attr, val)
         else:
             value = _convert_single_value(value)
-            for v in self._obj:
-                v.setAttr(attr, value)
+            if mobj is not None:
+                mobj.setAttr(attr, value)
+            else:
+                for v in objs:
+                    v.setAttr(attr, value)
         # Return the original series to allow method chaining
         return self._obj
 
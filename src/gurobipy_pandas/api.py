@@ -149,48 +149,54 @@ def add_vars(
     Series
         A Series of vars with the the index of `pandas_obj`
     """
-    if isinstance(pandas_obj, pd.Index):
-        # Use the given index as the base object. All attribute arguments must
-        # be single values, or series aligned with the index.
-        return add_vars_from_index(
-            model,
-            pandas_obj,
-            name=name,
-            lb=lb,
-            ub=ub,
-            obj=obj,
-            vtype=vtype,
-            index_formatter=index_formatter,
-        )
-    elif isinstance(pandas_obj, pd.Series):
-        # Use the index of the given series as the base object. All attribute
-        # arguments must be single values, or series on the same index as the
-        # given series.
-        return add_vars_from_index(
-            model,
-            pandas_obj.index,
-            name=name,
-            lb=lb,
-            ub=ub,
-            obj=obj,
-            vtype=vtype,
-            index_formatter=index_formatter,
-        )
-    elif isinstance(pandas_obj, pd.DataFrame):
-        # Use the given dataframe as the base object. All attribute arguments
-        # must be single values, or names of columns in the given dataframe.
-        return add_vars_from_dataframe(
-            model,
-            pandas_obj,
-            name=name,
-            lb=lb,
-            ub=ub,
-            obj=obj,
-            vtype=vtype,
-            index_formatter=index_formatter,
-        )
-    else:
+    handler = _add_vars_handler(type(pandas_obj))
+    if handler is None:
         raise ValueError("`pandas_obj` must be an index, series, or dataframe")
+    return handler(
+        model,
+        pandas_obj,
+        name=name,
+        lb=lb,
+        ub=ub,
+        obj=obj,
+        vtype=vtype,
+        index_formatter=index_formatter,
+    )
+
+
+def _add_vars_from_series(model, series, **kwargs):
+    # Use the index of the given series as the base object. All attribute
+    # arguments must be single values, or series on the same index as the
+    # given series.
+    return add_vars_from_index(model, series.index, **kwargs)
+
+
+# Handlers for add_vars keyed by the exact type of pandas_obj. For an index,
+# all attribute arguments must be single values or series aligned with the
+# index. For a dataframe, they must be single values or column names. Other
+# subclasses are resolved by issubclass on first use and then cached, so
+# repeated calls cost a single dict lookup.
+_ADD_VARS_HANDLERS = {
+    pd.Index: add_vars_from_index,
+    pd.RangeIndex: add_vars_from_index,
+    pd.MultiIndex: add_vars_from_index,
+    pd.DatetimeIndex: add_vars_from_index,
+    pd.Series: _add_vars_from_series,
+    pd.DataFrame: add_vars_from_dataframe,
+}
+
+
+def _add_vars_handler(obj_type):
+    try:
+        return _ADD_VARS_HANDLERS[obj_type]
+    except KeyError:
+        pass
+    for base_type in (pd.Index, pd.Series, pd.DataFrame):
+        if issubclass(obj_type, base_type):
+            handler = _ADD_VARS_HANDLERS[base_type]
+            _ADD_VARS_HANDLERS[obj_type] = handler
+            return handler
+    return None
 
 
 def add_constrs(
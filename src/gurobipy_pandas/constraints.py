@@ -3,14 +3,21 @@ Internal methods for adding constraints to a model using a pandas structure.
 These are used to build the actual API methods.
 """
 
+import itertools
 import re
+from functools import lru_cache
 from typing import Optional, Union
 
 import gurobipy as gp
 import pandas as pd
 from gurobipy import GRB
 
-from gurobipy_pandas.util import create_names, gppd_global_options
+from gurobipy_pandas.util import (
+    create_names,
+    gppd_global_options,
+    object_series,
+    same_entries,
+)
 
 CONSTRAINT_SENSES = frozenset([GRB.LESS_EQUAL, GRB.EQUAL, GRB.GREATER_EQUAL])
 
@@ -68,7 +75,7 @@ def add_constrs_from_series(
     index_formatter="default",
 ) -> pd.Series:
     if isinstance(lhs, pd.Series) and isinstance(rhs, pd.Series):
-        if not lhs.index.sort_values().equals(rhs.index.sort_values()):
+        if not same_entries(lhs.index, rhs.index):
             raise KeyError("series must be aligned")
 
     if isinstance(lhs, pd.Series) and lhs.isnull().any():
@@ -112,10 +119,7 @@ def _create_expressions_dataframe(df, expr):
             expr = expr.replace(backticked, newname)
             scope = scope.rename(columns={column: newname})
 
-    # Just get the first character of sense, to match the gurobipy enums
-    lhs, rhs = re.split("[<>=]+", expr)
-    sense = expr.replace(lhs, "").replace(rhs, "")[0]
-    assert sense in CONSTRAINT_SENSES
+    lhs, sense, rhs = _parse_expression(expr)
 
     # Evaluate both sides using python eval
     lhsseries = eval(lhs, None, scope)
@@ -143,6 +147,14 @@ def _add_constr(model, lhs, sense, rhs, name):
     return model.addLConstr(lhs, sense, rhs, name=name)
 
 
+def _row_values(data, arg, is_column):
+    """Return the values of column :arg for each row in :data, or :arg
+    repeated for each row if it is not a column reference."""
+    if is_column:
+        return data[arg].tolist()
+    return itertools.repeat(arg, len(data.index))
+
+
 def _add_constrs_from_dataframe_args(
     model: gp.Model,
     data: pd.DataFrame,
@@ -171,44 +183,40 @@ def _add_constrs_from_dataframe_args(
     else:
         names = [""] * len(data.index)
 
-    # Mappers from itertuple 'Pandas' objects to lhs/rhs values.
-    # Index into them numerically.
-    # TODO: it's possible adding a data column for lhs/rhs constants
-    # would be faster than the extra python function call? Revisit
-    # when we have better performance tests
-
-    if isinstance(lhs, str):
-        lhs_index = list(data.columns).index(lhs)
-        lhs_value = lambda row: row[lhs_index]
-    else:
-        lhs_value = lambda _: lhs
+    # Column references are read as lists of values, which is cheaper than
+    # building a namedtuple per row with itertuples. Scalars are repeated.
+    lhs_values = _row_values(data, lhs, isinstance(lhs, str))
 
     # Hopefully this is not an ambiguous rule: if sense is a valid Gurobi
     # sense character (i.e. '<', '>', or '=') then use it as the sense for
     # all constraints. Otherwise, assume it is a column name in the input
     # dataframe and take the sense strings from that column.
-    if sense in data.columns:
-        sense_index = list(data.columns).index(sense)
-        sense_value = lambda row: row[sense_index]
-    else:
-        sense_value = lambda _: sense
+    sense_values = _row_values(data, sense, sense in data.columns)
 
-    if isinstance(rhs, str):
-        rhs_index = list(data.columns).index(rhs)
-        rhs_value = lambda row: row[rhs_index]
-    else:
-        rhs_value = lambda _: rhs
+    rhs_values = _row_values(data, rhs, isinstance(rhs, str))
 
     constrs = [
-        _add_constr(
-            model,
-            lhs_value(row),
-            sense_value(row),
-            rhs_value(row),
-            name=name,
+        _add_constr(model, lhs_value, sense_value, rhs_value, name=name)
+        for name, lhs_value, sense_value, rhs_value in zip(
+            names, lhs_values, sense_values, rhs_values
         )
-        for name, row in zip(names, data.itertuples(index=False))
     ]
     if gppd_global_options["eager_updates"]:
         model.update()
-    return pd.Series(index=data.index, data=constrs, name=name)
+    return object_series(constrs, data.index, name=name)
+
+
+@lru_cache(maxsize=128)
+def _parse_expression(expr):
+    """Split a constraint expression into compiled left- and right-hand
+    sides and a sense. Cached, since the same expression string is
+    typically used repeatedly (e.g. when building constraints in a loop
+    over groups of a dataframe)."""
+    # Just get the first character of sense, to match the gurobipy enums
+    lhs, rhs = re.split("[<>=]+", expr)
+    sense = expr.replace(lhs, "").replace(rhs, "")[0]
+    assert sense in CONSTRAINT_SENSES
+
+    lhs_code = compile(lhs.strip(), "<lhs>", "eval")
+    rhs_code = compile(rhs.strip(), "<rhs>", "eval")
+    return lhs_code, sense, rhs_code
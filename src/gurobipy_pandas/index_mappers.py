@@ -9,15 +9,35 @@ These are not called directly by users, rather users should pass their own
 mapper in to var/constr adder methods if they want to change the behaviour.
 """
 
-from functools import partial
+import re
+from functools import lru_cache, partial
 
+import numpy as np
 import pandas as pd
 
+# Characters which are not allowed in LP file names. Runs of these (and of
+# whitespace) are replaced with a single underscore by the default mapper.
+_LP_UNSAFE_CHARS = re.compile(r"[\+\-\*\^\:\s]+")
+
 
 def create_mapper(arg):
     """Entry point for index mapping/formatting. Takes an argument the user
     would pass to top level functions, and returns a callable which should
     be applied to indexes before using them to create var/constr names."""
+    if isinstance(arg, str):
+        # Built-in mappers hold no state, so the same one can be handed out
+        # for repeated calls. User callables are not cached, so that no
+        # references to them are kept.
+        return _create_mapper_cached(arg)
+    return _create_mapper(arg)
+
+
+@lru_cache(maxsize=None)
+def _create_mapper_cached(arg):
+    return _create_mapper(arg)
+
+
+def _create_mapper(arg):
     if arg == "disable":
         # Pass through unchanged
         return lambda index: index
@@ -39,16 +59,37 @@ def create_mapper(arg):
 def _default_mapper(index):
     """Level mapper to be applied by default. Just does basic cleanup to avoid
     LP format issues."""
-    if pd.api.types.is_integer_dtype(index):
+    # Check dtype kinds directly, pd.api.types.is_*_dtype checks are slow
+    # by comparison
+    kind = index.dtype.kind
+    if kind in "iu":
         # Integers will always be string-formatted sanely later, no need to
         # do any heavy string manipulation here.
         return index
-    elif pd.api.types.is_datetime64_any_dtype(index):
+    elif kind == "M":
         # Map to an LP file friendly format
+        return _format_datetimes(index)
+    else:
+        # One pass in python with a precompiled pattern is cheaper than
+        # mapping to str and going through the pandas .str accessor.
+        sub = _LP_UNSAFE_CHARS.sub
+        return pd.Index(
+            [sub("_", str(value)) for value in index], dtype=object, name=index.name
+        )
+
+
+def _format_datetimes(index):
+    """Format a datetime index as %Y_%m_%dT%H_%M_%S strings. Timezone-aware
+    values are formatted in UTC. numpy formats the whole array in one call,
+    which is much cheaper than strftime per element; strftime is still used
+    if there are missing values, since numpy would format those as 'NaT'."""
+    if index.hasnans:
         mapped = pd.Series(index.values).dt.strftime("%Y_%m_%dT%H_%M_%S")
         return mapped.values
-    else:
-        return index.map(str).str.replace(r"[\+\-\*\^\:\s]+", "_", regex=True)
+    seconds = index.values.astype("datetime64[s]")
+    formatted = np.datetime_as_string(seconds, unit="s")
+    formatted = np.char.replace(np.char.replace(formatted, "-", "_"), ":", "_")
+    return formatted.astype(object)
 
 
 def _map_index_entries(index: pd.Index, mapper):
@@ -67,7 +108,7 @@ def _map_index_entries(index: pd.Index, mapper):
         if isinstance(index, pd.MultiIndex):
             levels = [index.get_level_values(i) for i in range(index.nlevels)]
             mapped_levels = [mapper(level) for level in levels]
-            return pd.MultiIndex.from_arrays(mapped_levels)
+            return _rebuild_multiindex(index, levels, mapped_levels)
         else:
             return mapper(index)
 
@@ -93,7 +134,16 @@ def _map_index_entries(index: pd.Index, mapper):
                 mapped_levels.append(map_func(level))
 
         if isinstance(index, pd.MultiIndex):
-            return pd.MultiIndex.from_arrays(mapped_levels)
+            return _rebuild_multiindex(index, levels, mapped_levels)
         else:
             assert len(levels) == 1
             return mapped_levels[0]
+
+
+def _rebuild_multiindex(index, levels, mapped_levels):
+    """Construct a multi-index from mapped level values. If no level was
+    changed by its mapper (e.g. all integer levels under the default mapper),
+    the original index is returned, avoiding the cost of rebuilding codes."""
+    if all(mapped is level for mapped, level in zip(mapped_levels, levels)):
+        return index
+    return pd.MultiIndex.from_arrays(mapped_levels)
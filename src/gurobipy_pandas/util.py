@@ -1,9 +1,13 @@
+import numpy as np
 import pandas as pd
 
 from gurobipy_pandas.index_mappers import create_mapper
 
 gppd_global_options = {"eager_updates": False}
 
+# np.fromiter supports object arrays from numpy 1.23
+_FROMITER_OBJECT = np.lib.NumpyVersion(np.__version__) >= "1.23.0"
+
 
 def align_series(series: pd.Series, index: pd.Index, err_label: str):
     """
@@ -15,25 +19,87 @@ def align_series(series: pd.Series, index: pd.Index, err_label: str):
     Raise a ValueError if there is any missing data once the series is aligned.
     """
 
-    if index is None:
+    if index is None or series.index.equals(index):
+        # Already aligned, no reindexing needed
         aligned = series
     else:
-        if not index.sort_values().equals(series.index.sort_values()):
+        if not same_entries(index, series.index):
             raise KeyError(f"'{err_label}' series not aligned with index")
         aligned = series.loc[index]
 
-    if aligned.isnull().any():
+    if _has_missing_values(aligned):
         raise ValueError(f"'{err_label}' series has missing values")
 
     return aligned
 
 
+def _has_missing_values(series: pd.Series) -> bool:
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype):
+        if dtype.kind in "iub":
+            # numpy integer and boolean arrays can't hold missing values
+            return False
+        if dtype.kind == "f":
+            return bool(np.isnan(series.to_numpy()).any())
+    return bool(series.isnull().any())
+
+
+def object_series(values: list, index: pd.Index, name=None) -> pd.Series:
+    """Wrap a list of gurobipy objects in a Series on :index. Building the
+    object array directly skips pandas' dtype inference over the list."""
+    if not _FROMITER_OBJECT:
+        return pd.Series(index=index, data=values, name=name)
+    data = np.fromiter(values, dtype=object, count=len(values))
+    return pd.Series(data, index=index, name=name, copy=False)
+
+
+def same_entries(index1: pd.Index, index2: pd.Index) -> bool:
+    """Check whether two indexes hold the same entries, ignoring order."""
+    if index1 is index2:
+        return True
+    if len(index1) != len(index2):
+        return False
+    if index1.has_duplicates or index2.has_duplicates:
+        # Compare as multisets; membership checks are not enough here
+        return index1.sort_values().equals(index2.sort_values())
+    # Same length and unique, so containment implies equality. isin is
+    # hash-based, avoiding two O(n log n) sorts.
+    return bool(index1.isin(index2).all())
+
+
 def _format_index(index):
     if isinstance(index, tuple):
         return ",".join(map(str, index))
     return str(index)
 
 
-def create_names(prefix, index, index_formatter):
+def _format_level(level):
+    """Convert an iterable of index values to an object array of strings."""
+    return np.array([str(value) for value in level], dtype=object)
+
+
+def _format_suffixes(index, index_formatter):
+    """Return an object array of bracketed name suffixes, '[i]' or '[i,j]',
+    for each entry of :index."""
     mapper = create_mapper(index_formatter)
-    return [f"{prefix}[{_format_index(entry)}]" for entry in mapper(index)]
+    mapped = mapper(index)
+    if isinstance(mapped, pd.MultiIndex):
+        # Stringify each level, then join levels with ',' using elementwise
+        # addition on object arrays (one C loop per level, rather than a
+        # python-level join per entry)
+        levels = (mapped.get_level_values(i) for i in range(mapped.nlevels))
+        suffixes = _format_level(next(levels))
+        for level in levels:
+            suffixes = suffixes + "," + _format_level(level)
+    elif getattr(mapped, "dtype", np.dtype(object)).kind != "O":
+        # Typed single level (e.g. integers), entries can't be tuples
+        suffixes = _format_level(mapped)
+    else:
+        # Entries of an object index or an arbitrary iterable from a custom
+        # mapper may still be tuples
+        suffixes = np.array([_format_index(entry) for entry in mapped], dtype=object)
+    return "[" + suffixes + "]"
+
+
+def create_names(prefix, index, index_formatter):
+    return (prefix + _format_suffixes(index, index_formatter)).tolist()
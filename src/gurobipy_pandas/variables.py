@@ -9,12 +9,18 @@ import gurobipy as gp
 import pandas as pd
 from gurobipy import GRB
 
-from gurobipy_pandas.util import align_series, create_names, gppd_global_options
+from gurobipy_pandas.util import (
+    align_series,
+    create_names,
+    gppd_global_options,
+    object_series,
+)
 
 
-def prepare_series(series: pd.Series, index: pd.Index, err_label: str):
+def prepare_series(series: pd.Series, index: pd.Index, err_label: str, dtype=None):
     """
-    Align :series with :index and return the values as a list.
+    Align :series with :index and return the values as a numpy array,
+    optionally cast to :dtype.
 
     Raise a KeyError on any mismatch between the index of :series and
     :index (reordering is ok).
@@ -22,8 +28,27 @@ def prepare_series(series: pd.Series, index: pd.Index, err_label: str):
     Raise a ValueError if there is any missing data once the series
     is aligned.
     """
-    aligned = align_series(series, index, err_label="...")
-    return list(aligned.values)
+    aligned = align_series(series, index, err_label=err_label)
+    return aligned.to_numpy(dtype=dtype)
+
+
+def _name_arg(prefix: str, index: pd.Index, index_formatter):
+    """Return the name argument for addMVar to create variables named by
+    :prefix and :index.
+
+    For a default range index (0, 1, ..., n-1), the built-in formatters leave
+    entries unchanged, and gurobipy generates the same names "prefix[i]" when
+    given just the prefix. Passing the string avoids building the names in
+    python.
+    """
+    if (
+        index_formatter in ("default", "disable")
+        and isinstance(index, pd.RangeIndex)
+        and index.start == 0
+        and index.step == 1
+    ):
+        return prefix
+    return create_names(prefix, index, index_formatter)
 
 
 def add_vars_from_index(
@@ -69,30 +94,30 @@ def add_vars_from_index(
         raise ValueError("Index contains duplicate entries, cannot create variables")
 
     if isinstance(lb, pd.Series):
-        lb = prepare_series(lb, index, "lb")
+        lb = prepare_series(lb, index, "lb", dtype=float)
     else:
         lb = float(lb)
 
     if isinstance(ub, pd.Series):
-        ub = prepare_series(ub, index, "ub")
+        ub = prepare_series(ub, index, "ub", dtype=float)
     else:
         ub = float(ub)
 
     if isinstance(obj, pd.Series):
-        obj = prepare_series(obj, index, "obj")
+        obj = prepare_series(obj, index, "obj", dtype=float)
     else:
         obj = float(obj)
 
     if isinstance(vtype, pd.Series):
-        vtype = prepare_series(vtype, index, "vtype")
+        vtype = prepare_series(vtype, index, "vtype").tolist()
     elif not isinstance(vtype, str):
         raise TypeError("'vtype' must be a string or series")
 
     if isinstance(name, pd.Series):
-        namearg = prepare_series(name, index, "name")
+        namearg = prepare_series(name, index, "name").tolist()
         seriesname = None
     elif isinstance(name, str):
-        namearg = create_names(name, index, index_formatter)
+        namearg = _name_arg(name, index, index_formatter)
         seriesname = name
     elif name is None:
         namearg = None
@@ -105,7 +130,7 @@ def add_vars_from_index(
     )
     if gppd_global_options["eager_updates"]:
         model.update()
-    return pd.Series(index=index, data=newvars.tolist(), name=seriesname)
+    return object_series(newvars.tolist(), index, name=seriesname)
 
 
 def add_vars_from_dataframe(
@@ -146,17 +171,17 @@ def add_vars_from_dataframe(
         raise ValueError("Index contains duplicate entries, cannot create variables")
 
     if isinstance(lb, str):
-        lb = prepare_series(data[lb], data.index, "lb")
+        lb = prepare_series(data[lb], data.index, "lb", dtype=float)
     else:
         lb = float(lb)
 
     if isinstance(ub, str):
-        ub = prepare_series(data[ub], data.index, "ub")
+        ub = prepare_series(data[ub], data.index, "ub", dtype=float)
     else:
         ub = float(ub)
 
     if isinstance(obj, str):
-        obj = prepare_series(data[obj], data.index, "obj")
+        obj = prepare_series(data[obj], data.index, "obj", dtype=float)
     else:
         obj = float(obj)
 
@@ -167,7 +192,7 @@ def add_vars_from_dataframe(
         raise TypeError("'name' must be a string or None")
 
     if name:
-        namearg = create_names(name, data.index, index_formatter)
+        namearg = _name_arg(name, data.index, index_formatter)
     else:
         namearg = None
 
@@ -176,4 +201,4 @@ def add_vars_from_dataframe(
     )
     if gppd_global_options["eager_updates"]:
         model.update()
-    return pd.Series(index=data.index, data=newvars.tolist(), name=name)
+    return object_series(newvars.tolist(), data.index, name=name)
@@ -5,14 +5,16 @@ from gurobipy import GRB
 from pandas.testing import assert_index_equal, assert_series_equal
 
 import gurobipy_pandas as gppd
+from gurobipy_pandas.accessors import _matrix_object
 
 from .utils import GurobiModelTestCase
 
 
 class TestDataFrameAddVars(GurobiModelTestCase):
-    def setUp(self):
-        super().setUp()
-        self.df = pd.DataFrame(
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._df_template = pd.DataFrame(
             index=[0, 2, 3],
             data=[
                 {"a": 1, "b": 2},
@@ -21,6 +23,10 @@ class TestDataFrameAddVars(GurobiModelTestCase):
             ],
         )
 
+    def setUp(self):
+        super().setUp()
+        self.df = self._df_template.copy(deep=False)
+
     def test_no_args(self):
         # Adds a series of gp.Var as named column. This should be the
         # simplest test we can have; the new column must have a name so
@@ -59,24 +65,23 @@ class TestDataFrameAddVars(GurobiModelTestCase):
     def test_set_bounds_by_column(self):
         result = self.df.gppd.add_vars(self.model, name="x", lb="a", ub="b")
         self.model.update()
-        for row in result.itertuples():
-            self.assertEqual(row.x.lb, row.a)
-            self.assertEqual(row.x.ub, row.b)
+        x = result["x"].tolist()
+        self.assertEqual(self.model.getAttr("LB", x), result["a"].tolist())
+        self.assertEqual(self.model.getAttr("UB", x), result["b"].tolist())
 
     def test_set_objective_by_column(self):
         result = self.df.gppd.add_vars(self.model, name="x", obj="a")
         self.model.update()
-        for row in result.itertuples():
-            self.assertEqual(row.x.obj, row.a)
+        x = result["x"].tolist()
+        self.assertEqual(self.model.getAttr("Obj", x), result["a"].tolist())
 
     def test_multiindex(self):
         df = self.df.assign(c=1).set_index(["b", "a"])
         result = df.gppd.add_vars(self.model, name="z")
         self.model.update()
         self.assertEqual(list(result.columns), ["c", "z"])
-        for row in result.itertuples():
-            ind = ",".join(map(str, row.Index))
-            self.assertEqual(row.z.VarName, f"z[{ind}]")
+        names = self.model.getAttr("VarName", result["z"].tolist())
+        self.assertEqual(names, [f"z[{b},{a}]" for b, a in result.index])
 
     def test_index_formatter(self):
         # Test that the index_formatter argument is passed through and applied.
@@ -111,7 +116,7 @@ class TestSeriesAttributes(GurobiModelTestCase):
 
     def test_var_get_bounds(self):
         df = pd.DataFrame(
-            data=np.random.randint(0, 10, size=(100, 5)).astype(float),
+            data=np.random.default_rng(0).integers(0, 10, size=(100, 5)).astype(float),
             columns=list("abcde"),
         ).gppd.add_vars(self.model, name="x", lb="a", ub="b")
         self.model.update()
@@ -148,6 +153,20 @@ class TestSeriesAttributes(GurobiModelTestCase):
         for i, start in enumerate(expected):
             self.assertEqual(x.loc[i].Start, start)
 
+    def test_setattr_int_two_models(self):
+        # Integer attributes set one by one (mixed models) take Python ints
+        with gp.Model(env=self.env) as other:
+            x = gppd.add_vars(self.model, pd.RangeIndex(2), name="x")
+            y = gppd.add_vars(other, pd.RangeIndex(2), name="y")
+            self.model.update()
+            other.update()
+            mixed = pd.Series([x[0], y[1]])
+            mixed.gppd.set_attr("BranchPriority", pd.Series([5, 6]))
+            self.model.update()
+            other.update()
+            self.assertEqual(x[0].BranchPriority, 5)
+            self.assertEqual(y[1].BranchPriority, 6)
+
     def test_setattr_series_mismatch(self):
         x = gppd.add_vars(self.model, pd.RangeIndex(5))
         self.model.update()
@@ -250,6 +269,104 @@ class TestSeriesGetAttrSetAttr(GurobiModelTestCase):
         for i in range(5):
             self.assertEqual(result.loc[i + 5].vtype, vtype[i + 5])
 
+    def test_constr_setattr_rhs_series(self):
+        index = pd.RangeIndex(3)
+        x = gppd.add_vars(self.model, index, name="x")
+        constrs = gppd.add_constrs(self.model, x, GRB.LESS_EQUAL, 1.0, name="c")
+        rhs = pd.Series(index=[2, 0, 1], data=[4.0, 2.0, 3.0])
+        constrs.gppd.set_attr("RHS", rhs)
+        self.model.update()
+        for i in range(3):
+            self.assertEqual(constrs[i].RHS, rhs[i])
+
+    def test_qconstr_getattr(self):
+        index = pd.RangeIndex(3)
+        x = gppd.add_vars(self.model, index, name="x")
+        qconstrs = gppd.add_constrs(self.model, x * x, GRB.LESS_EQUAL, 2.0, name="q")
+        self.model.update()
+        qcrhs = qconstrs.gppd.get_attr("QCRHS")
+        assert_series_equal(qcrhs, pd.Series(index=index, data=2.0, name="q"))
+        names = qconstrs.gppd.get_attr("QCName")
+        self.assertEqual(list(names), ["q[0]", "q[1]", "q[2]"])
+
+    def test_mixed_setattr_scalar(self):
+        # Series mixing object types fall back to setting one by one
+        index = pd.RangeIndex(2)
+        x = gppd.add_vars(self.model, index, name="x")
+        c = gppd.add_constrs(self.model, x, GRB.LESS_EQUAL, 1.0, name="c")
+        self.model.update()
+        mixed = pd.Series([x[0], c[1]])
+        with self.assertRaises(AttributeError):
+            mixed.gppd.set_attr("LB", 1.0)
+
+    def test_matrix_object_single_model(self):
+        # Series from one model are handled with a single matrix object, and
+        # objects from several models are not
+        x = gppd.add_vars(self.model, pd.RangeIndex(3), name="x")
+        c = gppd.add_constrs(self.model, x, GRB.LESS_EQUAL, 1.0, name="c")
+        self.model.update()
+        if not hasattr(gp.MVar, "fromlist"):
+            self.skipTest("gurobipy has no MVar.fromlist")
+        self.assertIsInstance(_matrix_object(x.tolist()), gp.MVar)
+        self.assertIsInstance(_matrix_object(c.tolist()), gp.MConstr)
+        with gp.Model(env=self.env) as other:
+            y = gppd.add_vars(other, pd.RangeIndex(3), name="y")
+            other.update()
+            self.assertIsNone(_matrix_object([x[0], y[1]]))
+
+    def test_getattr_two_models(self):
+        # Objects from different models each report their own attributes
+        with gp.Model(env=self.env) as other:
+            x = gppd.add_vars(self.model, pd.RangeIndex(3), name="x")
+            y = gppd.add_vars(other, pd.RangeIndex(3), name="y")
+            self.model.update()
+            other.update()
+            mixed = pd.Series([x[0], y[1], x[2]])
+            self.assertEqual(list(mixed.gppd.VarName), ["x[0]", "y[1]", "x[2]"])
+
+    def test_getattr_unavailable(self):
+        # Attributes which cannot be queried raise AttributeError, so that
+        # hasattr follows the usual protocol
+        x = gppd.add_vars(self.model, pd.RangeIndex(3), name="x")
+        self.model.update()
+        with self.assertRaises(AttributeError):
+            x.gppd.X
+        with self.assertRaises(AttributeError):
+            x.gppd.get_attr("X")
+        self.assertFalse(hasattr(x.gppd, "X"))
+
+    def test_getattr_int_dtype(self):
+        # Integer attributes come back with the same dtype as per-object values
+        x = gppd.add_vars(self.model, pd.RangeIndex(3), name="x")
+        x.gppd.set_attr("BranchPriority", 2)
+        self.model.update()
+        assert_series_equal(
+            x.gppd.BranchPriority,
+            pd.Series(index=x.index, data=[2, 2, 2], dtype=np.int64, name="x"),
+        )
+
+    def test_getattr_unknown(self):
+        # Unknown attributes are reported against the scalar gurobipy type
+        x = gppd.add_vars(self.model, pd.RangeIndex(3), name="x")
+        self.model.update()
+        with self.assertRaisesRegex(AttributeError, "'gurobipy.Var' object"):
+            x.gppd.get_attr("Foo")
+        self.assertEqual(list(x.gppd.VarName), ["x[0]", "x[1]", "x[2]"])
+
+    def test_setattr_two_models(self):
+        # Objects from different models must each get their own value
+        with gp.Model(env=self.env) as other:
+            x = gppd.add_vars(self.model, pd.RangeIndex(3), name="x")
+            y = gppd.add_vars(other, pd.RangeIndex(3), name="y")
+            self.model.update()
+            other.update()
+            mixed = pd.Series([x[0], y[1], x[2]])
+            mixed.gppd.set_attr("LB", pd.Series([1.0, 2.0, 3.0]))
+            self.model.update()
+            other.update()
+            self.assertEqual(self.model.getAttr("LB", x.tolist()), [1.0, 0.0, 3.0])
+            self.assertEqual(other.getAttr("LB", y.tolist()), [0.0, 2.0, 0.0])
+
     def test_setattr_series_mismatch(self):
         x = gppd.add_vars(self.model, pd.RangeIndex(5))
         self.model.update()
@@ -307,9 +424,10 @@ class TestSeriesGetAttrSetAttr(GurobiModelTestCase):
 
 
 class TestDataFrameAddConstrsByArgs(GurobiModelTestCase):
-    def setUp(self):
-        super().setUp()
-        self.df = pd.DataFrame(
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._df_template = pd.DataFrame(
             data=[
                 {"a": 1, "b": 2},
                 {"a": 3, "b": 4},
@@ -317,30 +435,30 @@ class TestDataFrameAddConstrsByArgs(GurobiModelTestCase):
             ],
         )
 
+    def setUp(self):
+        super().setUp()
+        self.df = self._df_template.copy(deep=False)
+
     def test_scalar_rhs(self):
         df = self.df.gppd.add_vars(self.model, name="x")
         result = df.gppd.add_constrs(self.model, "x", GRB.EQUAL, 1.0, name="constr")
         self.model.update()
-        for entry in result.itertuples():
-            self.assertEqual(entry.constr.sense, GRB.EQUAL)
-            self.assertEqual(entry.constr.rhs, 1.0)
-            self.assertEqual(entry.constr.ConstrName, f"constr[{entry.Index}]")
-            row = self.model.getRow(entry.constr)
+        self.assert_linear_constrs(result["constr"], GRB.EQUAL, 1.0, "constr")
+        for constr, x in zip(result["constr"], result["x"]):
+            row = self.model.getRow(constr)
             self.assertEqual(row.size(), 1)
-            self.assertIs(row.getVar(0), entry.x)
+            self.assertIs(row.getVar(0), x)
             self.assertEqual(row.getCoeff(0), 1.0)
 
     def test_scalar_lhs(self):
         df = self.df.gppd.add_vars(self.model, name="x")
         result = df.gppd.add_constrs(self.model, 1.0, GRB.EQUAL, "x", name="constr")
         self.model.update()
-        for entry in result.itertuples():
-            self.assertEqual(entry.constr.sense, GRB.EQUAL)
-            self.assertEqual(entry.constr.rhs, -1.0)
-            self.assertEqual(entry.constr.ConstrName, f"constr[{entry.Index}]")
-            row = self.model.getRow(entry.constr)
+        self.assert_linear_constrs(result["constr"], GRB.EQUAL, -1.0, "constr")
+        for constr, x in zip(result["constr"], result["x"]):
+            row = self.model.getRow(constr)
             self.assertEqual(row.size(), 1)
-            self.assertIs(row.getVar(0), entry.x)
+            self.assertIs(row.getVar(0), x)
             self.assertEqual(row.getCoeff(0), -1.0)
 
     def test_series_rhs(self):
@@ -349,19 +467,20 @@ class TestDataFrameAddConstrsByArgs(GurobiModelTestCase):
             self.model, "x", GRB.LESS_EQUAL, "b", name="constr"
         )
         self.model.update()
-        for entry in result.itertuples():
-            self.assertIsInstance(entry.constr, gp.Constr)
-            self.assertEqual(entry.constr.sense, GRB.LESS_EQUAL)
-            self.assertEqual(entry.constr.rhs, entry.b)
-            self.assertEqual(entry.constr.ConstrName, f"constr[{entry.Index}]")
-            row = self.model.getRow(entry.constr)
+        for constr in result["constr"]:
+            self.assertIsInstance(constr, gp.Constr)
+        self.assert_linear_constrs(
+            result["constr"], GRB.LESS_EQUAL, result["b"], "constr"
+        )
+        for constr, x in zip(result["constr"], result["x"]):
+            row = self.model.getRow(constr)
             self.assertEqual(row.size(), 1)
-            self.assertIs(row.getVar(0), entry.x)
+            self.assertIs(row.getVar(0), x)
             self.assertEqual(row.getCoeff(0), 1.0)
 
     def test_quadratic(self):
         df = self.df.gppd.add_vars(self.model, name="x")
-        df["x2"] = df["x"] * df["x"] + 1
+        df["x2"] = pd.Series([v * v + 1 for v in df["x"].to_numpy()], index=df.index)
         result = df.gppd.add_constrs(
             self.model, "x", GRB.LESS_EQUAL, "x2", name="constr"
         )
@@ -410,9 +529,9 @@ class TestDataFrameAddConstrsByArgs(GurobiModelTestCase):
 
     def test_nonpython_columnnames(self):
         # Create a column with a name not admissible as a python variable name,
-        # check we can still reference it without issues (itertuples is used
-        # as a fast iterator for constraint generation, so such edge cases
-        # can fail if looking up by attribute names).
+        # check we can still reference it without issues (such edge cases
+        # can fail if constraint generation looks up columns by attribute
+        # names).
         df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}).gppd.add_vars(
             self.model, name="ab cd"
         )
@@ -461,9 +580,10 @@ class TestDataFrameAddConstrsByArgs(GurobiModelTestCase):
 
 
 class TestDataFrameAddConstrsByExpression(GurobiModelTestCase):
-    def setUp(self):
-        super().setUp()
-        self.df = pd.DataFrame(
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._df_template = pd.DataFrame(
             data=[
                 {"a": 1, "b": 2},
                 {"a": 3, "b": 4},
@@ -471,43 +591,43 @@ class TestDataFrameAddConstrsByExpression(GurobiModelTestCase):
             ],
         )
 
+    def setUp(self):
+        super().setUp()
+        self.df = self._df_template.copy(deep=False)
+
     def test_scalar_rhs(self):
         df = self.df.gppd.add_vars(self.model, name="x")
         result = df.gppd.add_constrs(self.model, "x == 1", name="constr")
         self.model.update()
-        for entry in result.itertuples():
-            self.assertEqual(entry.constr.sense, GRB.EQUAL)
-            self.assertEqual(entry.constr.rhs, 1.0)
-            self.assertEqual(entry.constr.ConstrName, f"constr[{entry.Index}]")
-            row = self.model.getRow(entry.constr)
+        self.assert_linear_constrs(result["constr"], GRB.EQUAL, 1.0, "constr")
+        for constr, x in zip(result["constr"], result["x"]):
+            row = self.model.getRow(constr)
             self.assertEqual(row.size(), 1)
-            self.assertIs(row.getVar(0), entry.x)
+            self.assertIs(row.getVar(0), x)
             self.assertEqual(row.getCoeff(0), 1.0)
 
     def test_scalar_lhs(self):
         df = self.df.gppd.add_vars(self.model, name="x")
         result = df.gppd.add_constrs(self.model, "1 == x", name="constr")
         self.model.update()
-        for entry in result.itertuples():
-            self.assertEqual(entry.constr.sense, GRB.EQUAL)
-            self.assertEqual(entry.constr.rhs, -1.0)
-            self.assertEqual(entry.constr.ConstrName, f"constr[{entry.Index}]")
-            row = self.model.getRow(entry.constr)
+        self.assert_linear_constrs(result["constr"], GRB.EQUAL, -1.0, "constr")
+        for constr, x in zip(result["constr"], result["x"]):
+            row = self.model.getRow(constr)
             self.assertEqual(row.size(), 1)
-            self.assertIs(row.getVar(0), entry.x)
+            self.assertIs(row.getVar(0), x)
             self.assertEqual(row.getCoeff(0), -1.0)
 
     def test_series_rhs(self):
         df = self.df.gppd.add_vars(self.model, name="x")
         result = df.gppd.add_constrs(self.model, "x <= b", name="constr")
         self.model.update()
-        for entry in result.itertuples():
-            self.assertEqual(entry.constr.sense, GRB.LESS_EQUAL)
-            self.assertEqual(entry.constr.rhs, entry.b)
-            self.assertEqual(entry.constr.ConstrName, f"constr[{entry.Index}]")
-            row = self.model.getRow(entry.constr)
+        self.assert_linear_constrs(
+            result["constr"], GRB.LESS_EQUAL, result["b"], "constr"
+        )
+        for constr, x in zip(result["constr"], result["x"]):
+            row = self.model.getRow(constr)
             self.assertEqual(row.size(), 1)
-            self.assertIs(row.getVar(0), entry.x)
+            self.assertIs(row.getVar(0), x)
             self.assertEqual(row.getCoeff(0), 1.0)
 
     def test_expressions(self):
@@ -518,16 +638,16 @@ class TestDataFrameAddConstrsByExpression(GurobiModelTestCase):
         self.model.update()
         self.assertEqual(df.shape, (3, 4))
         self.assertEqual(result.shape, (3, 5))
-        for entry in result.itertuples():
-            self.assertEqual(entry.constr.sense, GRB.LESS_EQUAL)
-            self.assertEqual(entry.constr.rhs, 1 - entry.b)
-            self.assertEqual(entry.constr.ConstrName, f"constr[{entry.Index}]")
-            row = self.model.getRow(entry.constr)
-            self.assertEqual(row.size(), 2)
-            self.assertIs(row.getVar(0), entry.x)
-            self.assertIs(row.getVar(1), entry.y)
-            self.assertEqual(row.getCoeff(0), 1.0)
-            self.assertEqual(row.getCoeff(1), 2.0)
+        self.assert_linear_constrs(
+            result["constr"], GRB.LESS_EQUAL, 1 - result["b"], "constr"
+        )
+        rows = [self.model.getRow(constr) for constr in result["constr"]]
+        self.assertEqual([row.size() for row in rows], [2] * 3)
+        self.assertEqual([row.getCoeff(0) for row in rows], [1.0] * 3)
+        self.assertEqual([row.getCoeff(1) for row in rows], [2.0] * 3)
+        for row, x, y in zip(rows, result["x"], result["y"]):
+            self.assertIs(row.getVar(0), x)
+            self.assertIs(row.getVar(1), y)
 
     def test_quadratic(self):
         df = self.df.gppd.add_vars(self.model, name="x")
@@ -33,10 +33,14 @@ class TestAddVars(GurobiModelTestCase):
         self.assertEqual(flow.name, "flow")
         assert_index_equal(flow.index, data.index)
 
-        # Names/types are correct and match the index (checking individual objects)
-        for (source, sink), flowvar in flow.items():
-            self.assertEqual(flowvar.VarName, f"flow[{source},{sink}]")
-            self.assertEqual(flowvar.VType, GRB.CONTINUOUS)
+        # Names/types are correct and match the index
+        self.assertEqual(
+            self.model.getAttr("VarName", flow.tolist()),
+            [f"flow[{source},{sink}]" for source, sink in data.index],
+        )
+        self.assertEqual(
+            self.model.getAttr("VType", flow.tolist()), [GRB.CONTINUOUS] * 4
+        )
 
         # Attributes are correct, using the series accessors to validate
         self.assertTrue((flow.gppd.LB == 0).all())
@@ -57,10 +61,12 @@ class TestAddVars(GurobiModelTestCase):
         self.assertEqual(x.name, "x")
         assert_index_equal(x.index, series.index)
 
-        # Names/types are correct and match the index (checking individual objects)
-        for index, variable in x.items():
-            self.assertEqual(variable.VarName, f"x[{index}]")
-            self.assertEqual(variable.VType, GRB.BINARY)
+        # Names/types are correct and match the index
+        self.assertEqual(
+            self.model.getAttr("VarName", x.tolist()),
+            [f"x[{index}]" for index in series.index],
+        )
+        self.assertEqual(self.model.getAttr("VType", x.tolist()), [GRB.BINARY] * 5)
 
         # Attributes are correct, using the series accessors to validate
         self.assertTrue((x.gppd.LB == 0.0).all())
@@ -82,75 +88,53 @@ class TestAddVars(GurobiModelTestCase):
         self.assertEqual(x.name, "x")
         assert_index_equal(x.index, index)
 
-        # Names/types are correct and match the index (checking individual objects)
-        for ind, variable in x.items():
-            self.assertEqual(variable.VarName, f"x[{ind}]")
-            self.assertEqual(variable.VType, GRB.CONTINUOUS)
+        # Names/types are correct and match the index
+        self.assertEqual(
+            self.model.getAttr("VarName", x.tolist()), [f"x[{ind}]" for ind in index]
+        )
+        self.assertEqual(self.model.getAttr("VType", x.tolist()), [GRB.CONTINUOUS] * 5)
 
         # Attributes are correct, using the series accessors to validate
         self.assertTrue((x.gppd.LB == 0.0).all())
         self.assertTrue((x.gppd.UB >= 1e100).all())
         assert_series_equal(x.gppd.Obj, objseries, check_names=False)
 
+    def add_vars_each_input(self, index, **kwargs):
+        # Add variables from an index, series and dataframe on the same
+        # index, updating the model once. Returns (label, varseries) pairs.
+        inputs = [
+            ("index", index),
+            ("series", pd.Series(index=index, data=[1, 2, 3])),
+            ("dataframe", pd.DataFrame(index=index, data={"a": [1, 2, 3]})),
+        ]
+        results = [
+            (label, gppd.add_vars(self.model, obj, **kwargs)) for label, obj in inputs
+        ]
+        self.model.update()
+        return results
+
     def test_names_1(self):
         # Default name sanitization
         index = pd.Index(["a  b", "c^d", "e+f"])
         expect_names = ["x[a_b]", "x[c_d]", "x[e_f]"]
 
-        with self.subTest(obj="index"):
-            x = gppd.add_vars(self.model, index, name="x")
-            self.model.update()
-            for ind, name in zip(index, expect_names):
-                self.assertEqual(x[ind].VarName, name)
-
-        with self.subTest(obj="series"):
-            x = gppd.add_vars(
-                self.model, pd.Series(index=index, data=[1, 2, 3]), name="x"
-            )
-            self.model.update()
-            for ind, name in zip(index, expect_names):
-                self.assertEqual(x[ind].VarName, name)
-
-        with self.subTest(obj="dataframe"):
-            x = gppd.add_vars(
-                self.model, pd.DataFrame(index=index, data={"a": [1, 2, 3]}), name="x"
-            )
-            self.model.update()
-            for ind, name in zip(index, expect_names):
-                self.assertEqual(x[ind].VarName, name)
+        for label, x in self.add_vars_each_input(index, name="x"):
+            with self.subTest(obj=label):
+                self.assertEqual(
+                    self.model.getAttr("VarName", x.tolist()), expect_names
+                )
 
     def test_names_2(self):
         # Disable name sanitization
         index = pd.Index(["a  b", "c^d", "e+f"])
         expect_names = ["x[a  b]", "x[c^d]", "x[e+f]"]
 
-        with self.subTest(obj="index"):
-            x = gppd.add_vars(self.model, index, name="x", index_formatter="disable")
-            self.model.update()
-            for ind, name in zip(index, expect_names):
-                self.assertEqual(x[ind].VarName, name)
-
-        with self.subTest(obj="series"):
-            x = gppd.add_vars(
-                self.model,
-                pd.Series(index=index, data=[1, 2, 3]),
-                name="x",
-                index_formatter="disable",
-            )
-            self.model.update()
-            for ind, name in zip(index, expect_names):
-                self.assertEqual(x[ind].VarName, name)
-
-        with self.subTest(obj="dataframe"):
-            x = gppd.add_vars(
-                self.model,
-                pd.DataFrame(index=index, data={"a": [1, 2, 3]}),
-                name="x",
-                index_formatter="disable",
-            )
-            self.model.update()
-            for ind, name in zip(index, expect_names):
-                self.assertEqual(x[ind].VarName, name)
+        results = self.add_vars_each_input(index, name="x", index_formatter="disable")
+        for label, x in results:
+            with self.subTest(obj=label):
+                self.assertEqual(
+                    self.model.getAttr("VarName", x.tolist()), expect_names
+                )
 
     def test_names_3(self):
         # User provided formatter
@@ -159,33 +143,12 @@ class TestAddVars(GurobiModelTestCase):
         formatter = lambda index: index.map(simple_mapping)
         expect_names = ["x[1]", "x[4]", "x[9]"]
 
-        with self.subTest(obj="index"):
-            x = gppd.add_vars(self.model, index, name="x", index_formatter=formatter)
-            self.model.update()
-            for ind, name in zip(index, expect_names):
-                self.assertEqual(x[ind].VarName, name)
-
-        with self.subTest(obj="series"):
-            x = gppd.add_vars(
-                self.model,
-                pd.Series(index=index, data=[1, 2, 3]),
-                name="x",
-                index_formatter=formatter,
-            )
-            self.model.update()
-            for ind, name in zip(index, expect_names):
-                self.assertEqual(x[ind].VarName, name)
-
-        with self.subTest(obj="dataframe"):
-            x = gppd.add_vars(
-                self.model,
-                pd.DataFrame(index=index, data={"a": [1, 2, 3]}),
-                name="x",
-                index_formatter=formatter,
-            )
-            self.model.update()
-            for ind, name in zip(index, expect_names):
-                self.assertEqual(x[ind].VarName, name)
+        results = self.add_vars_each_input(index, name="x", index_formatter=formatter)
+        for label, x in results:
+            with self.subTest(obj=label):
+                self.assertEqual(
+                    self.model.getAttr("VarName", x.tolist()), expect_names
+                )
 
 
 class TestAddConstrs(GurobiModelTestCase):
@@ -210,10 +173,10 @@ class TestAddConstrs(GurobiModelTestCase):
         self.assertEqual(constrs.name, "cons")
         assert_index_equal(constrs.index, index)
 
-        # Constraint data per object
-        for ind, constr in constrs.items():
-            self.assertEqual(constr.ConstrName, f"cons[{ind}]")
-            self.assert_linexpr_equal(self.model.getRow(constr), 2 * x[ind] + y[ind])
+        # Constraint names and rows
+        self.assert_constr_names(constrs, "cons[{}]")
+        for constr, ref in zip(constrs, 2 * x + y):
+            self.assert_linexpr_equal(self.model.getRow(constr), ref)
 
         # Check data using accessors
         self.assertTrue((constrs.gppd.Sense == GRB.LESS_EQUAL).all())
@@ -228,7 +191,7 @@ class TestAddConstrs(GurobiModelTestCase):
         with self.subTest(index_formatter="default"):
             constrs = gppd.add_constrs(self.model, x, GRB.LESS_EQUAL, y, name="c")
             self.model.update()
-            names = list(constrs.gppd.ConstrName)
+            names = self.model.getAttr("ConstrName", constrs.tolist())
             self.assertEqual(names, ["c[a_b]", "c[c_d]", "c[e_f]"])
 
         with self.subTest(index_formatter="disable"):
@@ -236,7 +199,7 @@ class TestAddConstrs(GurobiModelTestCase):
                 self.model, x, GRB.LESS_EQUAL, y, name="c", index_formatter="disable"
             )
             self.model.update()
-            names = list(constrs.gppd.ConstrName)
+            names = self.model.getAttr("ConstrName", constrs.tolist())
             self.assertEqual(names, ["c[a  b]", "c[c*d]", "c[e:f]"])
 
         with self.subTest(index_formatter="callable"):
@@ -245,7 +208,7 @@ class TestAddConstrs(GurobiModelTestCase):
                 self.model, x, GRB.LESS_EQUAL, y, name="c", index_formatter=index_map
             )
             self.model.update()
-            names = list(constrs.gppd.ConstrName)
+            names = self.model.getAttr("ConstrName", constrs.tolist())
             self.assertEqual(names, ["c[2]", "c[4]", "c[8]"])
 
     def test_sense_series(self):
@@ -305,6 +268,23 @@ class TestDataValidation(GurobiModelTestCase):
         ):
             gppd.add_constrs(self.model, x, 3.5, y)
 
+    def test_bad_pandas_obj(self):
+        with self.assertRaisesRegex(
+            ValueError, "`pandas_obj` must be an index, series, or dataframe"
+        ):
+            gppd.add_vars(self.model, [1, 2, 3], name="x")
+
+    def test_index_subclass(self):
+        # Index subclasses without a registered handler resolve to the
+        # index handler
+        index = pd.CategoricalIndex(["a", "b", "a", "c"]).unique()
+
+        x = gppd.add_vars(self.model, index, name="x")
+
+        self.model.update()
+        self.assertEqual(self.model.NumVars, 3)
+        assert_index_equal(x.index, index)
+
 
 class TestNonInteractiveMode(GurobiModelTestCase):
     # Check that no updates are run by default.
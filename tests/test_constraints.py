@@ -16,6 +16,11 @@ from gurobipy_pandas.variables import add_vars_from_index
 from .utils import GurobiModelTestCase
 
 
+def default_names(constrs):
+    # Names gurobipy gives to unnamed linear constraints
+    return [f"R{i}" for i in range(len(constrs))]
+
+
 class TestAddConstrsFromDataFrame(GurobiModelTestCase):
     def test_scalar_rhs(self):
         x = add_vars_from_index(self.model, pd.RangeIndex(5, 10), name="x")
@@ -33,11 +38,9 @@ class TestAddConstrsFromDataFrame(GurobiModelTestCase):
         assert_index_equal(constrs.index, df.index)
 
         # Check data in the model
-        for i, (index, constr) in enumerate(constrs.items()):
-            self.assertEqual(constr.ConstrName, f"R{i}")
-            self.assertEqual(constr.RHS, 1.0)
-            self.assertEqual(constr.Sense, GRB.LESS_EQUAL)
-            self.assert_linexpr_equal(self.model.getRow(constr), 1.0 * x[index])
+        self.assert_linear_constrs(constrs, GRB.LESS_EQUAL, 1.0, default_names(constrs))
+        for constr, xi in zip(constrs, x):
+            self.assert_linexpr_equal(self.model.getRow(constr), 1.0 * xi)
 
     def test_scalar_rhs_quad(self):
         x = add_vars_from_index(self.model, pd.RangeIndex(5, 10), name="x")
@@ -57,13 +60,10 @@ class TestAddConstrsFromDataFrame(GurobiModelTestCase):
         assert_index_equal(qconstrs.index, df.index)
 
         # Check data in the model
-        for i, (index, qconstr) in enumerate(qconstrs.items()):
-            self.assertEqual(qconstr.QCName, "")
-            self.assertEqual(qconstr.QCRHS, 1.0)
-            self.assertEqual(qconstr.QCSense, GRB.LESS_EQUAL)
-            self.assert_quadexpr_equal(
-                self.model.getQCRow(qconstr), 1.0 * x[index] * x[index]
-            )
+        self.assert_quad_constrs(qconstrs, GRB.LESS_EQUAL, 1.0, [""] * 5)
+        expected_quads = [1.0 * v * v for v in x.to_numpy()]
+        for qconstr, expected in zip(qconstrs, expected_quads):
+            self.assert_quadexpr_equal(self.model.getQCRow(qconstr), expected)
 
     def test_scalar_lhs(self):
         x = add_vars_from_index(self.model, pd.RangeIndex(5, 10), name="x")
@@ -81,11 +81,11 @@ class TestAddConstrsFromDataFrame(GurobiModelTestCase):
         assert_index_equal(constrs.index, df.index)
 
         # Check data in the model
-        for i, (index, constr) in enumerate(constrs.items()):
-            self.assertEqual(constr.ConstrName, f"R{i}")
-            self.assertEqual(constr.RHS, -1.0)
-            self.assertEqual(constr.Sense, GRB.LESS_EQUAL)
-            self.assert_linexpr_equal(self.model.getRow(constr), -1.0 * x[index])
+        self.assert_linear_constrs(
+            constrs, GRB.LESS_EQUAL, -1.0, default_names(constrs)
+        )
+        for constr, xi in zip(constrs, x):
+            self.assert_linexpr_equal(self.model.getRow(constr), -1.0 * xi)
 
     def test_scalar_lhs_quad(self):
         x = add_vars_from_index(self.model, pd.RangeIndex(5, 10), name="x")
@@ -105,13 +105,10 @@ class TestAddConstrsFromDataFrame(GurobiModelTestCase):
         assert_index_equal(qconstrs.index, df.index)
 
         # Check data in the model
-        for i, (index, qconstr) in enumerate(qconstrs.items()):
-            self.assertEqual(qconstr.QCName, "")
-            self.assertEqual(qconstr.QCRHS, -2.0)
-            self.assertEqual(qconstr.QCSense, GRB.LESS_EQUAL)
-            self.assert_quadexpr_equal(
-                self.model.getQCRow(qconstr), -1.0 * x[index] * x[index]
-            )
+        self.assert_quad_constrs(qconstrs, GRB.LESS_EQUAL, -2.0, [""] * 5)
+        expected_quads = [-1.0 * v * v for v in x.to_numpy()]
+        for qconstr, expected in zip(qconstrs, expected_quads):
+            self.assert_quadexpr_equal(self.model.getQCRow(qconstr), expected)
 
     def test_bothcolumns(self):
         x = add_vars_from_index(self.model, pd.RangeIndex(5, 9), name="x")
@@ -130,11 +127,9 @@ class TestAddConstrsFromDataFrame(GurobiModelTestCase):
         assert_index_equal(constrs.index, df.index)
 
         # Check data and names in the model
-        for i, (index, constr) in enumerate(constrs.items()):
-            self.assertEqual(constr.ConstrName, f"R{i}")
-            self.assertEqual(constr.RHS, 0.0)
-            self.assertEqual(constr.Sense, GRB.EQUAL)
-            self.assert_linexpr_equal(self.model.getRow(constr), x[index] - y[index])
+        self.assert_linear_constrs(constrs, GRB.EQUAL, 0.0, default_names(constrs))
+        for constr, ref in zip(constrs, x - y):
+            self.assert_linexpr_equal(self.model.getRow(constr), ref)
 
     def test_names(self):
         x = add_vars_from_index(self.model, pd.RangeIndex(5, 9), name="x")
@@ -155,8 +150,7 @@ class TestAddConstrsFromDataFrame(GurobiModelTestCase):
         assert_index_equal(constrs.index, df.index)
 
         # Check names in the model
-        for index, constr in constrs.items():
-            self.assertEqual(constr.ConstrName, f"constr[{index}]")
+        self.assert_constr_names(constrs, "constr[{}]")
 
     def test_names_multiindex(self):
         df = add_vars_from_index(
@@ -179,8 +173,7 @@ class TestAddConstrsFromDataFrame(GurobiModelTestCase):
         assert_index_equal(constrs.index, df.index)
 
         # Check names in the model
-        for (i1, i2), constr in constrs.items():
-            self.assertEqual(constr.ConstrName, f"BND[{i1},{i2}]")
+        self.assert_constr_names(constrs, "BND[{},{}]")
 
     def test_expression_1(self):
         # Linear series <= constant series
@@ -204,11 +197,9 @@ class TestAddConstrsFromDataFrame(GurobiModelTestCase):
         assert_index_equal(constrs.index, data.index)
 
         # Check data in model
-        for index, constr in constrs.items():
-            self.assertEqual(constr.ConstrName, f"linear1[{index}]")
-            self.assertEqual(constr.Sense, GRB.LESS_EQUAL)
-            self.assertEqual(constr.RHS, a[index])
-            self.assert_linexpr_equal(self.model.getRow(constr), x[index] + y[index])
+        self.assert_linear_constrs(constrs, GRB.LESS_EQUAL, a, "linear1")
+        for constr, ref in zip(constrs, x + y):
+            self.assert_linexpr_equal(self.model.getRow(constr), ref)
 
     def test_expression_2(self):
         # Linear series == constant value
@@ -232,11 +223,9 @@ class TestAddConstrsFromDataFrame(GurobiModelTestCase):
         assert_index_equal(constrs.index, data.index)
 
         # Check data in model
-        for index, constr in constrs.items():
-            self.assertEqual(constr.ConstrName, f"linear2[{index}]")
-            self.assertEqual(constr.Sense, GRB.EQUAL)
-            self.assertEqual(constr.RHS, 1.0)
-            self.assert_linexpr_equal(self.model.getRow(constr), x[index] + y[index])
+        self.assert_linear_constrs(constrs, GRB.EQUAL, 1.0, "linear2")
+        for constr, ref in zip(constrs, x + y):
+            self.assert_linexpr_equal(self.model.getRow(constr), ref)
 
     def test_expression_3(self):
         # constant value >= linear series
@@ -258,11 +247,11 @@ class TestAddConstrsFromDataFrame(GurobiModelTestCase):
         assert_index_equal(constrs.index, data.index)
 
         # Check data in model
-        for i, (index, constr) in enumerate(constrs.items()):
-            self.assertEqual(constr.ConstrName, f"R{i}")
-            self.assertEqual(constr.Sense, GRB.GREATER_EQUAL)
-            self.assertEqual(constr.RHS, a[index] - 2.0)
-            self.assert_linexpr_equal(self.model.getRow(constr), -1.0 * x[index])
+        self.assert_linear_constrs(
+            constrs, GRB.GREATER_EQUAL, a - 2.0, default_names(constrs)
+        )
+        for constr, xi in zip(constrs, x):
+            self.assert_linexpr_equal(self.model.getRow(constr), -1.0 * xi)
 
     def test_expression_4(self):
         # quadratic series >= linear series
@@ -286,18 +275,15 @@ class TestAddConstrsFromDataFrame(GurobiModelTestCase):
         assert_index_equal(qconstrs.index, data.index)
 
         # Check data in model
-        for index, qconstr in qconstrs.items():
-            self.assertEqual(qconstr.QCName, f"quad[{index}]")
-            self.assertEqual(qconstr.QCSense, GRB.GREATER_EQUAL)
-            self.assertEqual(qconstr.QCRHS, 5.0)
-            ref = x[index] * y[index] - y[index] * a[index]
+        self.assert_quad_constrs(qconstrs, GRB.GREATER_EQUAL, 5.0, "quad")
+        for qconstr, ref in zip(qconstrs, x * y - y * a):
             self.assert_quadexpr_equal(self.model.getQCRow(qconstr), ref)
 
     def test_nonpython_columnnames(self):
         # Create a column with a name not admissible as a python variable name,
-        # check we can still reference it without issues (itertuples is used
-        # as a fast iterator for constraint generation, so such edge cases
-        # can fail if looking up by attribute names).
+        # check we can still reference it without issues (such edge cases
+        # can fail if constraint generation looks up columns by attribute
+        # names).
         data = add_vars_from_index(self.model, pd.RangeIndex(3)).to_frame(name="ab cd")
         data["ef gh"] = 4
 
@@ -306,14 +292,13 @@ class TestAddConstrsFromDataFrame(GurobiModelTestCase):
         )
 
         self.model.update()
-        for ind in data.index:
-            constr = constrs.loc[ind]
+        for constr, var in zip(constrs, data["ab cd"]):
             self.assertIsInstance(constr, gp.Constr)
             self.assertEqual(constr.Sense, GRB.LESS_EQUAL)
             self.assertEqual(constr.RHS, 4.0)
             row = self.model.getRow(constr)
             self.assertEqual(row.size(), 1)
-            self.assertIs(row.getVar(0), data.loc[ind, "ab cd"])
+            self.assertIs(row.getVar(0), var)
             self.assertEqual(row.getCoeff(0), 1.0)
 
 
@@ -339,11 +324,9 @@ class TestAddConstrsFromSeries(GurobiModelTestCase):
         assert_index_equal(constrs.index, index)
 
         # Check data in model
-        for ind, constr in constrs.items():
-            self.assertEqual(constr.ConstrName, f"linear[{ind}]")
-            self.assertEqual(constr.Sense, GRB.LESS_EQUAL)
-            self.assertEqual(constr.RHS, -1.0)
-            self.assert_linexpr_equal(self.model.getRow(constr), x[ind] - 2 * y[ind])
+        self.assert_linear_constrs(constrs, GRB.LESS_EQUAL, -1.0, "linear")
+        for constr, ref in zip(constrs, x - 2 * y):
+            self.assert_linexpr_equal(self.model.getRow(constr), ref)
 
     def test_lhs_scalar(self):
         # scalar == linear series
@@ -363,11 +346,9 @@ class TestAddConstrsFromSeries(GurobiModelTestCase):
         assert_index_equal(constrs.index, index)
 
         # Check data in model
-        for i, (ind, constr) in enumerate(constrs.items()):
-            self.assertEqual(constr.ConstrName, f"R{i}")
-            self.assertEqual(constr.Sense, GRB.EQUAL)
-            self.assertEqual(constr.RHS, 1.0)
-            self.assert_linexpr_equal(self.model.getRow(constr), gp.LinExpr(x[ind]))
+        self.assert_linear_constrs(constrs, GRB.EQUAL, 1.0, default_names(constrs))
+        for constr, xi in zip(constrs, x):
+            self.assert_linexpr_equal(self.model.getRow(constr), gp.LinExpr(xi))
 
     def test_rhs_scalar(self):
         # scalar >= linear series
@@ -387,11 +368,11 @@ class TestAddConstrsFromSeries(GurobiModelTestCase):
         assert_index_equal(constrs.index, index)
 
         # Check data in model
-        for i, (ind, constr) in enumerate(constrs.items()):
-            self.assertEqual(constr.ConstrName, f"R{i}")
-            self.assertEqual(constr.Sense, GRB.GREATER_EQUAL)
-            self.assertEqual(constr.RHS, -1.0)
-            self.assert_linexpr_equal(self.model.getRow(constr), -2.0 * x[ind])
+        self.assert_linear_constrs(
+            constrs, GRB.GREATER_EQUAL, -1.0, default_names(constrs)
+        )
+        for constr, xi in zip(constrs, x):
+            self.assert_linexpr_equal(self.model.getRow(constr), -2.0 * xi)
 
     def test_quad_series(self):
         # quad == linear
@@ -415,11 +396,8 @@ class TestAddConstrsFromSeries(GurobiModelTestCase):
         assert_index_equal(qconstrs.index, index)
 
         # Check data in model
-        for (ind1, ind2), qconstr in qconstrs.items():
-            self.assertEqual(qconstr.QCName, f"Q[{ind1},{ind2}]")
-            self.assertEqual(qconstr.QCSense, GRB.EQUAL)
-            self.assertEqual(qconstr.QCRHS, 1)
-            ref = x[ind1, ind2] * y[ind1, ind2] - z[ind1, ind2] * 3
+        self.assert_quad_constrs(qconstrs, GRB.EQUAL, 1.0, "Q")
+        for qconstr, ref in zip(qconstrs, x * y - z * 3):
             self.assert_quadexpr_equal(self.model.getQCRow(qconstr), ref)
 
     def test_misaligned_series(self):
@@ -456,10 +434,9 @@ class TestAddConstrsFromSeries(GurobiModelTestCase):
         self.assertIsInstance(constrs, pd.Series)
         assert_index_equal(constrs.index, index)
 
-        for i in index:
-            self.assertEqual(constrs[i].Sense, sense[i])
-            self.assertEqual(constrs[i].RHS, -1.0)
-            self.assert_linexpr_equal(self.model.getRow(constrs[i]), x[i] - y[i])
+        self.assert_linear_constrs(constrs, sense, -1.0)
+        for constr, ref in zip(constrs, x - y):
+            self.assert_linexpr_equal(self.model.getRow(constr), ref)
 
     def test_sense_series_2(self):
         index = pd.RangeIndex(5)
@@ -475,10 +452,9 @@ class TestAddConstrsFromSeries(GurobiModelTestCase):
         self.assertIsInstance(constrs, pd.Series)
         assert_index_equal(constrs.index, index)
 
-        for i in index:
-            self.assertEqual(constrs[i].Sense, sense[i][0])
-            self.assertEqual(constrs[i].RHS, -1.0)
-            self.assert_linexpr_equal(self.model.getRow(constrs[i]), x[i] - y[i])
+        self.assert_linear_constrs(constrs, sense.str[0], -1.0)
+        for constr, ref in zip(constrs, x - y):
+            self.assert_linexpr_equal(self.model.getRow(constr), ref)
 
 
 class TestExpressionParser(unittest.TestCase):
@@ -506,3 +482,15 @@ class TestExpressionParser(unittest.TestCase):
         result, sense = _create_expressions_dataframe(data, expression)
         assert_frame_equal(result, expected_result)
         self.assertEqual(sense, expected_sense)
+
+    def test_repeated_expression(self):
+        # Parsed expressions are cached; reusing an expression string must
+        # still evaluate against the new dataframe
+        for offset in [0.0, 1.0]:
+            data = pd.DataFrame({"x": [1.0, 2.0], "y": [3.0, 4.0]}) + offset
+            result, sense = _create_expressions_dataframe(data, "x <= 2 * y")
+            assert_frame_equal(
+                result,
+                pd.DataFrame({"lhs": data["x"], "rhs": 2 * data["y"]}),
+            )
+            self.assertEqual(sense, GRB.LESS_EQUAL)
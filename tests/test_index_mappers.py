@@ -1,5 +1,7 @@
 import datetime
+import gc
 import unittest
+import weakref
 
 import pandas as pd
 
@@ -125,6 +127,12 @@ class TestDefaultMapper(unittest.TestCase):
             ["2021_01_18T12_32_41", "2021_01_19T12_32_41", "2021_01_20T12_32_41"],
         )
 
+    def test_timestamp_subsecond(self):
+        # Fractional seconds are truncated, as with strftime
+        index = pd.DatetimeIndex(["2021-01-18 12:32:41.999", "1969-12-31 23:59:59.5"])
+        mapped = self.mapper(index)
+        self.assertEqual(list(mapped), ["2021_01_18T12_32_41", "1969_12_31T23_59_59"])
+
     def test_multi_index(self):
         # Multi index -> iterable of tuples, string mapping for objects dtypes
         intindex = pd.RangeIndex(2)
@@ -147,6 +155,16 @@ class TestDefaultMapper(unittest.TestCase):
             ],
         )
 
+    def test_multi_index_int(self):
+        # Nothing to map for integer levels, the index is returned as-is
+        index = pd.MultiIndex.from_product([pd.RangeIndex(2), pd.RangeIndex(3)])
+        mapped = self.mapper(index)
+        self.assertIs(mapped, index)
+
+    def test_mapper_reused(self):
+        # Mappers are stateless, repeated requests return the same object
+        self.assertIs(create_mapper("default"), self.mapper)
+
 
 class TestCustomMapperCallable(unittest.TestCase):
     # Creating the mapper from a callable applies the callable to all levels in
@@ -174,6 +192,17 @@ class TestCustomMapperCallable(unittest.TestCase):
         ]
         self.assertEqual(list(mapped), expected)
 
+    def test_callable_not_retained(self):
+        # No reference to a user callable is kept once the mapper is released
+        def formatter(index):
+            return index
+
+        ref = weakref.ref(formatter)
+        create_mapper(formatter)
+        del formatter
+        gc.collect()
+        self.assertIsNone(ref())
+
 
 class TestCustomMapperDict(unittest.TestCase):
     # Creating the mapper from a dict applies specific formatters to indexes
@@ -1,7 +1,7 @@
 import gurobipy as gp
 import pandas as pd
 from gurobipy import GRB
-from pandas.testing import assert_index_equal
+from pandas.testing import assert_index_equal, assert_series_equal
 
 from gurobipy_pandas.variables import add_vars_from_dataframe, add_vars_from_index
 
@@ -25,13 +25,7 @@ class TestAddVarsFromIndex(GurobiModelTestCase):
         self.assertIsNone(varseries.name)
         assert_index_equal(varseries.index, index)
 
-        for i, ind in enumerate(index):
-            v = varseries[ind]
-            self.assertEqual(v.LB, 0.0)
-            self.assertGreater(v.UB, 1e100)
-            self.assertEqual(v.Obj, 0.0)
-            self.assertEqual(v.VType, GRB.CONTINUOUS)
-            self.assertEqual(v.VarName, f"C{i}")
+        self.assert_default_vars(varseries, [f"C{i}" for i in range(len(varseries))])
 
     def test_rangeindex_generatednames(self):
         # Variables are created for each entry in index, with prefixed
@@ -47,13 +41,7 @@ class TestAddVarsFromIndex(GurobiModelTestCase):
         self.assertEqual(varseries.name, "x")
         assert_index_equal(varseries.index, index)
 
-        for ind in index:
-            v = varseries[ind]
-            self.assertEqual(v.LB, 0.0)
-            self.assertGreater(v.UB, 1e100)
-            self.assertEqual(v.Obj, 0.0)
-            self.assertEqual(v.VType, GRB.CONTINUOUS)
-            self.assertEqual(v.VarName, f"x[{ind}]")
+        self.assert_default_vars(varseries, [f"x[{ind}]" for ind in index])
 
     def test_multiindex_noargs(self):
         # Variables are created for each entry in index, with default names
@@ -70,13 +58,7 @@ class TestAddVarsFromIndex(GurobiModelTestCase):
         self.assertIsNone(varseries.name)
         assert_index_equal(varseries.index, index)
 
-        for i, ind in enumerate(index):
-            v = varseries[ind]
-            self.assertEqual(v.LB, 0.0)
-            self.assertGreater(v.UB, 1e100)
-            self.assertEqual(v.Obj, 0.0)
-            self.assertEqual(v.VType, GRB.CONTINUOUS)
-            self.assertEqual(v.VarName, f"C{i}")
+        self.assert_default_vars(varseries, [f"C{i}" for i in range(len(varseries))])
 
     def test_multiindex_generatednames(self):
         # Variables are created for each entry in index, with prefixed
@@ -93,13 +75,21 @@ class TestAddVarsFromIndex(GurobiModelTestCase):
         self.assertEqual(varseries.name, "ball")
         assert_index_equal(varseries.index, index)
 
+        self.assert_default_vars(varseries, [f"ball[{n},{c}]" for n, c in index])
+
+    def test_multiindex_generatednames_shared_index(self):
+        # Several series of variables created on the same index get names
+        # with their own prefixes
+        tuples = [(1, "red"), (1, "blue"), (2, "red"), (2, "blue")]
+        index = pd.MultiIndex.from_tuples(tuples, names=("number", "color"))
+
+        x = add_vars_from_index(self.model, index, name="x")
+        y = add_vars_from_index(self.model, index, name="y")
+
+        self.model.update()
         for number, color in index:
-            v = varseries[number, color]
-            self.assertEqual(v.LB, 0.0)
-            self.assertGreater(v.UB, 1e100)
-            self.assertEqual(v.Obj, 0.0)
-            self.assertEqual(v.VType, GRB.CONTINUOUS)
-            self.assertEqual(v.VarName, f"ball[{number},{color}]")
+            self.assertEqual(x[number, color].VarName, f"x[{number},{color}]")
+            self.assertEqual(y[number, color].VarName, f"y[{number},{color}]")
 
     def test_name_series(self):
         # Variables are created for each entry in index, with explicit names
@@ -115,9 +105,10 @@ class TestAddVarsFromIndex(GurobiModelTestCase):
         self.assertIsNone(varseries.name)
         assert_index_equal(varseries.index, index)
 
-        for ind, name in zip([4, 5, 6, 7], ["a", "b", "c", "d"]):
-            v = varseries[ind]
-            self.assertEqual(v.VarName, name)
+        varnames = pd.Series(
+            self.model.getAttr("VarName", varseries.tolist()), index=varseries.index
+        )
+        assert_series_equal(varnames, pd.Series(index=index, data=["a", "b", "c", "d"]))
 
     def test_name_series_reordered(self):
         # Variables are created for each entry in index, with explicit names
@@ -133,9 +124,10 @@ class TestAddVarsFromIndex(GurobiModelTestCase):
         self.assertIsNone(varseries.name)
         assert_index_equal(varseries.index, index)
 
-        for ind, name in zip([4, 5, 6, 7], ["d", "c", "b", "a"]):
-            v = varseries[ind]
-            self.assertEqual(v.VarName, name)
+        varnames = pd.Series(
+            self.model.getAttr("VarName", varseries.tolist()), index=varseries.index
+        )
+        assert_series_equal(varnames, pd.Series(index=index, data=["d", "c", "b", "a"]))
 
     def test_name_series_mismatch(self):
         index = pd.RangeIndex(5)
@@ -158,15 +150,6 @@ class TestAddVarsFromIndex(GurobiModelTestCase):
         with self.assertRaises(ValueError):
             add_vars_from_index(self.model, index, name=names)
 
-    def test_lb_value(self):
-        index = pd.RangeIndex(5)
-
-        # All variables assigned the same lower bound
-        varseries = add_vars_from_index(self.model, index, lb=-1.0)
-        self.model.update()
-        for _, v in varseries.items():
-            self.assertEqual(v.LB, -1.0)
-
     def test_lb_series(self):
         index = pd.RangeIndex(5)
 
@@ -174,38 +157,32 @@ class TestAddVarsFromIndex(GurobiModelTestCase):
         lbseries = pd.Series(index=index, data=[1, 2, 3, 4, 5])
         varseries = add_vars_from_index(self.model, index, lb=lbseries)
         self.model.update()
-        for ind in index:
-            self.assertEqual(varseries[ind].LB, lbseries[ind])
-
-    def test_lb_series_mismatch(self):
-        index = pd.RangeIndex(5)
+        self.assertEqual(
+            self.model.getAttr("LB", varseries.tolist()), lbseries.loc[index].tolist()
+        )
 
-        # Missing entries for some values in the index
-        with self.assertRaises(KeyError):
-            lbseries = pd.Series(index=pd.RangeIndex(1, 4), data=[1, 2, 3])
-            add_vars_from_index(self.model, index, lb=lbseries)
+    def test_lb_series_reordered_mixed_types(self):
+        # Alignment check does not require the index to be sortable
+        index = pd.Index(["a", 1, "b"])
 
-        # Too many values (require exact alignment)
-        with self.assertRaises(KeyError):
-            lbseries = pd.Series(index=pd.RangeIndex(6), data=[1, 2, 3, 4, 5, 6])
-            add_vars_from_index(self.model, index, lb=lbseries)
+        lbseries = pd.Series(index=["b", "a", 1], data=[3.0, 1.0, 2.0])
+        varseries = add_vars_from_index(self.model, index, lb=lbseries)
+        self.model.update()
+        self.assertEqual(
+            self.model.getAttr("LB", varseries.tolist()), lbseries.loc[index].tolist()
+        )
 
-    def test_lb_series_missing_values(self):
+    def test_series_error_labels(self):
+        # Errors name the offending argument
         index = pd.RangeIndex(5)
 
-        # Missing values
-        with self.assertRaises(ValueError):
-            lbseries = pd.Series(index=index, data=[0, None, 1, 2, None])
-            add_vars_from_index(self.model, index, lb=lbseries)
-
-    def test_ub_value(self):
-        index = pd.RangeIndex(5)
+        with self.assertRaisesRegex(KeyError, "'ub' series not aligned"):
+            ubseries = pd.Series(index=pd.RangeIndex(1, 4), data=[1, 2, 3])
+            add_vars_from_index(self.model, index, ub=ubseries)
 
-        # All variables assigned the same lower bound
-        varseries = add_vars_from_index(self.model, index, ub=10.0)
-        self.model.update()
-        for _, v in varseries.items():
-            self.assertEqual(v.UB, 10.0)
+        with self.assertRaisesRegex(ValueError, "'obj' series has missing values"):
+            objseries = pd.Series(index=index, data=[0, None, 1, 2, None])
+            add_vars_from_index(self.model, index, obj=objseries)
 
     def test_ub_series(self):
         index = pd.RangeIndex(5)
@@ -214,38 +191,9 @@ class TestAddVarsFromIndex(GurobiModelTestCase):
         ubseries = pd.Series(index=[4, 3, 2, 1, 0], data=[1, 2, 3, 4, 5])
         varseries = add_vars_from_index(self.model, index, ub=ubseries)
         self.model.update()
-        for ind in index:
-            self.assertEqual(varseries[ind].UB, ubseries[ind])
-
-    def test_ub_series_mismatch(self):
-        index = pd.RangeIndex(5)
-
-        # Missing entries for some values in the index
-        with self.assertRaises(KeyError):
-            ubseries = pd.Series(index=pd.RangeIndex(1, 4), data=[1, 2, 3])
-            add_vars_from_index(self.model, index, ub=ubseries)
-
-        # Too many values (require exact alignment)
-        with self.assertRaises(KeyError):
-            ubseries = pd.Series(index=pd.RangeIndex(6), data=[1, 2, 3, 4, 5, 6])
-            add_vars_from_index(self.model, index, ub=ubseries)
-
-    def test_ub_series_missing_values(self):
-        index = pd.RangeIndex(5)
-
-        # Missing values
-        with self.assertRaises(ValueError):
-            ubseries = pd.Series(index=index, data=[0, None, 1, 2, None])
-            add_vars_from_index(self.model, index, ub=ubseries)
-
-    def test_obj_value(self):
-        index = pd.RangeIndex(5)
-
-        # All variables assigned the same lower bound
-        varseries = add_vars_from_index(self.model, index, obj=10.0)
-        self.model.update()
-        for _, v in varseries.items():
-            self.assertEqual(v.Obj, 10.0)
+        self.assertEqual(
+            self.model.getAttr("UB", varseries.tolist()), ubseries.loc[index].tolist()
+        )
 
     def test_obj_series(self):
         index = pd.RangeIndex(5)
@@ -254,38 +202,9 @@ class TestAddVarsFromIndex(GurobiModelTestCase):
         objseries = pd.Series(index=[1, 2, 0, 4, 3], data=[5, 4, 3, 2, 1])
         varseries = add_vars_from_index(self.model, index, obj=objseries)
         self.model.update()
-        for ind in index:
-            self.assertEqual(varseries[ind].Obj, objseries[ind])
-
-    def test_obj_series_mismatch(self):
-        index = pd.RangeIndex(5)
-
-        # Missing entries for some values in the index
-        with self.assertRaises(KeyError):
-            objseries = pd.Series(index=pd.RangeIndex(1, 4), data=[1, 2, 3])
-            add_vars_from_index(self.model, index, obj=objseries)
-
-        # Too many values (require exact alignment)
-        with self.assertRaises(KeyError):
-            objseries = pd.Series(index=pd.RangeIndex(6), data=[1, 2, 3, 4, 5, 6])
-            add_vars_from_index(self.model, index, obj=objseries)
-
-    def test_obj_series_missing_values(self):
-        index = pd.RangeIndex(5)
-
-        # Missing values
-        with self.assertRaises(ValueError):
-            objseries = pd.Series(index=index, data=[0, None, 1, 2, None])
-            add_vars_from_index(self.model, index, obj=objseries)
-
-    def test_vtype_value(self):
-        index = pd.RangeIndex(5)
-
-        # All variables assigned the same lower bound
-        varseries = add_vars_from_index(self.model, index, vtype=GRB.BINARY)
-        self.model.update()
-        for _, v in varseries.items():
-            self.assertEqual(v.VType, GRB.BINARY)
+        self.assertEqual(
+            self.model.getAttr("Obj", varseries.tolist()), objseries.loc[index].tolist()
+        )
 
     def test_vtype_series(self):
         index = pd.RangeIndex(5)
@@ -294,29 +213,55 @@ class TestAddVarsFromIndex(GurobiModelTestCase):
         vtypeseries = pd.Series(index=[3, 4, 2, 0, 1], data=["B", "I", "C", "S", "N"])
         varseries = add_vars_from_index(self.model, index, vtype=vtypeseries)
         self.model.update()
-        for ind in index:
-            self.assertEqual(varseries[ind].VType, vtypeseries[ind])
+        self.assertEqual(
+            self.model.getAttr("VType", varseries.tolist()),
+            vtypeseries.loc[index].tolist(),
+        )
 
-    def test_vtype_series_mismatch(self):
+    def test_attribute_values(self):
+        # A scalar attribute value is assigned to all variables
         index = pd.RangeIndex(5)
 
-        # Missing entries for some values in the index
-        with self.assertRaises(KeyError):
-            vtypeseries = pd.Series(index=pd.RangeIndex(1, 4), data=["B", "I", "C"])
-            add_vars_from_index(self.model, index, vtype=vtypeseries)
+        cases = [("LB", -1.0), ("UB", 10.0), ("Obj", 10.0), ("VType", GRB.BINARY)]
+        for attr, value in cases:
+            with self.subTest(attr=attr):
+                varseries = add_vars_from_index(
+                    self.model, index, **{attr.lower(): value}
+                )
+                self.model.update()
+                self.assertEqual(
+                    self.model.getAttr(attr, varseries.tolist()), [value] * 5
+                )
+
+    def test_attribute_series_mismatch(self):
+        index = pd.RangeIndex(5)
 
-        # Too many values (require exact alignment)
-        with self.assertRaises(KeyError):
-            vtypeseries = pd.Series(index=pd.RangeIndex(8), data=["B"] * 8)
-            add_vars_from_index(self.model, index, vtype=vtypeseries)
+        for attr, value in [("lb", 1.0), ("ub", 1.0), ("obj", 1.0), ("vtype", "B")]:
+            with self.subTest(attr=attr):
+                # Missing entries for some values in the index
+                with self.assertRaises(KeyError):
+                    series = pd.Series(index=pd.RangeIndex(1, 4), data=value)
+                    add_vars_from_index(self.model, index, **{attr: series})
+
+                # Too many values (require exact alignment)
+                with self.assertRaises(KeyError):
+                    series = pd.Series(index=pd.RangeIndex(6), data=value)
+                    add_vars_from_index(self.model, index, **{attr: series})
 
-    def test_vtype_series_missing_values(self):
+    def test_attribute_series_missing_values(self):
         index = pd.RangeIndex(5)
 
-        # Missing values
-        with self.assertRaises(ValueError):
-            vtypeseries = pd.Series(index=index, data=["C", None, "I", "B", None])
-            add_vars_from_index(self.model, index, vtype=vtypeseries)
+        cases = [
+            ("lb", [0, None, 1, 2, None]),
+            ("ub", [0, None, 1, 2, None]),
+            ("obj", [0, None, 1, 2, None]),
+            ("vtype", ["C", None, "I", "B", None]),
+        ]
+        for attr, data in cases:
+            with self.subTest(attr=attr):
+                with self.assertRaises(ValueError):
+                    series = pd.Series(index=index, data=data)
+                    add_vars_from_index(self.model, index, **{attr: series})
 
     def test_attribute_wrongtypes(self):
         # If series are not passed for attributes, they must be scalar
@@ -377,6 +322,21 @@ class TestAddVarsFromIndex(GurobiModelTestCase):
             expected = f"x[202204{dtvalue.day:02d},{strvalue}]"
             self.assertEqual(x[dtvalue, strvalue].VarName, expected)
 
+    def test_custom_index_formatter_not_cached(self):
+        # User formatters need not be pure functions; names must reflect
+        # the formatter's behaviour at each call, even on the same index
+        index = pd.Index(["a", "b"])
+        mapping = {"a": "a", "b": "b"}
+        formatter = lambda idx: idx.map(mapping)
+
+        x = add_vars_from_index(self.model, index, name="x", index_formatter=formatter)
+        mapping["a"] = "z"
+        y = add_vars_from_index(self.model, index, name="x", index_formatter=formatter)
+        self.model.update()
+
+        self.assertEqual(self.model.getAttr("VarName", x.tolist()), ["x[a]", "x[b]"])
+        self.assertEqual(self.model.getAttr("VarName", y.tolist()), ["x[z]", "x[b]"])
+
     def test_index_duplicates(self):
         index = pd.Index([0, 1, 1, 2])
         self.assertTrue(index.has_duplicates)
@@ -491,8 +451,9 @@ class TestAddVarsFromDataFrame(GurobiModelTestCase):
         varseries = add_vars_from_dataframe(self.model, self.data, lb=-100)
 
         self.model.update()
-        for _, v in varseries.items():
-            self.assertEqual(v.LB, -100.0)
+        self.assertEqual(
+            self.model.getAttr("LB", varseries.tolist()), [-100.0] * len(varseries)
+        )
 
     def test_lb_column(self):
         # lb string value interpreted as a column to reference
@@ -500,8 +461,10 @@ class TestAddVarsFromDataFrame(GurobiModelTestCase):
         varseries = add_vars_from_dataframe(self.model, self.data, lb="float1")
 
         self.model.update()
-        for ind, v in varseries.items():
-            self.assertEqual(v.LB, self.data.loc[ind, "float1"])
+        self.assertEqual(
+            self.model.getAttr("LB", varseries.tolist()),
+            self.data["float1"].tolist(),
+        )
 
     def test_ub_value(self):
         # ub numeric value assigned to all variables
@@ -509,8 +472,9 @@ class TestAddVarsFromDataFrame(GurobiModelTestCase):
         varseries = add_vars_from_dataframe(self.model, self.data, ub=5)
 
         self.model.update()
-        for _, v in varseries.items():
-            self.assertEqual(v.UB, 5.0)
+        self.assertEqual(
+            self.model.getAttr("UB", varseries.tolist()), [5.0] * len(varseries)
+        )
 
     def test_ub_column(self):
         # ub string value interpreted as a column to reference
@@ -518,8 +482,10 @@ class TestAddVarsFromDataFrame(GurobiModelTestCase):
         varseries = add_vars_from_dataframe(self.model, self.data, ub="float2")
 
         self.model.update()
-        for ind, v in varseries.items():
-            self.assertEqual(v.UB, self.data.loc[ind, "float2"])
+        self.assertEqual(
+            self.model.getAttr("UB", varseries.tolist()),
+            self.data["float2"].tolist(),
+        )
 
     def test_obj_value(self):
         # obj numeric value assigned to all variables
@@ -527,8 +493,9 @@ class TestAddVarsFromDataFrame(GurobiModelTestCase):
         varseries = add_vars_from_dataframe(self.model, self.data, obj=1.0)
 
         self.model.update()
-        for _, v in varseries.items():
-            self.assertEqual(v.Obj, 1.0)
+        self.assertEqual(
+            self.model.getAttr("Obj", varseries.tolist()), [1.0] * len(varseries)
+        )
 
     def test_obj_column(self):
         # obj string value interpreted as a column to reference
@@ -536,8 +503,10 @@ class TestAddVarsFromDataFrame(GurobiModelTestCase):
         varseries = add_vars_from_dataframe(self.model, self.data, obj="float1")
 
         self.model.update()
-        for ind, v in varseries.items():
-            self.assertEqual(v.Obj, self.data.loc[ind, "float1"])
+        self.assertEqual(
+            self.model.getAttr("Obj", varseries.tolist()),
+            self.data["float1"].tolist(),
+        )
 
     def test_vtype_value(self):
         # vtype can only be a string value, giving all variables the
@@ -546,8 +515,10 @@ class TestAddVarsFromDataFrame(GurobiModelTestCase):
         varseries = add_vars_from_dataframe(self.model, self.data, vtype=GRB.BINARY)
 
         self.model.update()
-        for _, v in varseries.items():
-            self.assertEqual(v.VType, GRB.BINARY)
+        self.assertEqual(
+            self.model.getAttr("VType", varseries.tolist()),
+            [GRB.BINARY] * len(varseries),
+        )
 
     def test_attribute_series(self):
         # passing attributes as a series should fail (even if aligned)
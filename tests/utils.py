@@ -1,16 +1,75 @@
 import unittest
 
 import gurobipy as gp
+import pandas as pd
+from gurobipy import GRB
 
 
 class GurobiModelTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # One environment per test class; each test still gets a fresh model.
+        # Test models are tiny, so a single thread avoids thread startup and
+        # oversubscription when test processes run in parallel.
+        cls.env = gp.Env(empty=True)
+        cls.env.setParam("OutputFlag", 0)
+        cls.env.setParam("Threads", 1)
+        cls.env.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.env.close()
+
     def setUp(self):
-        self.env = gp.Env()
         self.model = gp.Model(env=self.env)
 
     def tearDown(self):
         self.model.close()
-        self.env.close()
+
+    def assert_default_vars(self, varseries, names):
+        # Check a series of variables has default attributes (continuous,
+        # bounds [0, inf], zero objective) and the expected list of names,
+        # using one batched attribute query each
+        vs = varseries.tolist()
+        n = len(vs)
+        self.assertEqual(self.model.getAttr("LB", vs), [0.0] * n)
+        self.assertTrue(all(ub > 1e100 for ub in self.model.getAttr("UB", vs)))
+        self.assertEqual(self.model.getAttr("Obj", vs), [0.0] * n)
+        self.assertEqual(self.model.getAttr("VType", vs), [GRB.CONTINUOUS] * n)
+        self.assertEqual(self.model.getAttr("VarName", vs), list(names))
+
+    def assert_linear_constrs(self, constrs, sense, rhs, name=None):
+        # Check Sense, RHS and ConstrName of a series of linear constraints
+        # using one batched attribute query each. sense and rhs may be
+        # scalars or sequences aligned with constrs. name is either the name
+        # prefix passed when adding (giving names like "name[i]"), a list of
+        # expected names, or None to skip the name check.
+        self._assert_constrs(constrs, ("Sense", "RHS", "ConstrName"), sense, rhs, name)
+
+    def assert_quad_constrs(self, constrs, sense, rhs, name=None):
+        # As assert_linear_constrs, for a series of quadratic constraints
+        self._assert_constrs(constrs, ("QCSense", "QCRHS", "QCName"), sense, rhs, name)
+
+    def _assert_constrs(self, constrs, attrs, sense, rhs, name):
+        sense_attr, rhs_attr, name_attr = attrs
+        clist = constrs.tolist()
+        n = len(clist)
+        self.assertEqual(self.model.getAttr(sense_attr, clist), _expand(sense, n))
+        self.assertEqual(self.model.getAttr(rhs_attr, clist), _expand(rhs, n))
+        if isinstance(name, str):
+            fields = ",".join(["{}"] * constrs.index.nlevels)
+            self.assert_constr_names(constrs, name + "[" + fields + "]", name_attr)
+        elif name is not None:
+            self.assertEqual(self.model.getAttr(name_attr, clist), list(name))
+
+    def assert_constr_names(self, constrs, pattern, name_attr="ConstrName"):
+        # Check names (ConstrName or QCName) of a series of constraints against
+        # pattern, formatted with each index entry (tuples are unpacked)
+        expected = [
+            pattern.format(*ind) if isinstance(ind, tuple) else pattern.format(ind)
+            for ind in constrs.index
+        ]
+        self.assertEqual(self.model.getAttr(name_attr, constrs.tolist()), expected)
 
     def assert_expression_equal(self, expr1, expr2):
         if isinstance(expr1, gp.LinExpr):
@@ -36,3 +95,10 @@ class GurobiModelTestCase(unittest.TestCase):
             self.assertTrue(expr1.getVar1(i).sameAs(expr2.getVar1(i)))
             self.assertTrue(expr1.getVar2(i).sameAs(expr2.getVar2(i)))
             self.assertEqual(expr1.getCoeff(i), expr2.getCoeff(i))
+
+
+def _expand(value, n):
+    # Expected attribute values: list-likes are taken as-is, scalars repeated
+    if pd.api.types.is_list_like(value):
+        return list(value)
+    return [value] * n